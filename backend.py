@@ -5,15 +5,29 @@ and job application tracking with Google Sheets integration for job rows only.
 Uses SQLite as a lightweight local database.
 """
 
+import atexit
+import itertools
+import os
+import queue
+import re
 import sqlite3
-import bcrypt
-import validators
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+import bcrypt
 import gspread
 from google.oauth2.service_account import Credentials
 
 DB_NAME = "users.db"
 
+# bcrypt work factor for password hashes; each +1 doubles the time a login or
+# registration spends hashing. Tune it to the latency you can afford per login.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+if not 4 <= BCRYPT_ROUNDS <= 31:
+    # bcrypt.gensalt rejects anything else; fail at startup, not on every login
+    raise ValueError(f"BCRYPT_ROUNDS must be between 4 and 31, got {BCRYPT_ROUNDS}")
+
 # ----------------------------
 # Google Sheets config (EDIT)
 # ----------------------------
@@ -22,27 +36,68 @@ SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 SHEET_ID = "1DbxpXxkFSJ9D3Acep9U7aOcnKe9rGBIoh7y56ucLlrg"  # <-- replace with your Sheet ID
 # ----------------------------------------------------------------
 
+SHEET_HEADERS = [
+    "User Email", "Job Link", "Company Name", "Job Role", "Job Location", "Status",
+    "Recruiter Name", "Recruiter Email", "Recruiter Phone", "Days Since Created",
+    "Comments", "Created At"
+]
+SHEET_HEADER_RANGE = "A1:L1"  # row 1, one cell per header
 
-def get_db_connection():
-    return sqlite3.connect(DB_NAME)
+SHEETS_TIMEOUT = 30        # seconds allowed per Sheets API request
+SHEETS_DRAIN_TIMEOUT = 10  # seconds exit waits for queued Sheets writes
 
+# Sheets appends and deletes go through this queue so a save or delete returns
+# right after the SQLite write. A single worker keeps them in submit order;
+# on exit it gets up to SHEETS_DRAIN_TIMEOUT to finish what is still queued.
+_gs_q = queue.Queue()
+_gs_worker_lock = threading.Lock()
+_gs_worker_thread = None
+_GS_STOP = object()  # queued by _gs_drain; the worker exits when it reaches it
+
+
+_local = threading.local()
+
+# Applied to every new connection. journal_mode=WAL persists in the file (see
+# init_db) but is repeated here in case the database was created elsewhere.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
 
-def init_db():
-    """
-    Completely reset database: drop all tables if exist and recreate fresh.
-    This ensures no leftover data in users, profiles, or job_applications.
-    """
-    conn = get_db_connection()
-    c = conn.cursor()
 
-    # Drop all tables if they exist
-    c.execute("DROP TABLE IF EXISTS job_applications;")
-    c.execute("DROP TABLE IF EXISTS user_profiles;")
-    c.execute("DROP TABLE IF EXISTS users;")
+def _utc_now_iso() -> str:
+    """created_at value for new rows: naive UTC, ISO 8601."""
+    return datetime.utcnow().isoformat()
 
-    # Recreate tables
+
+def get_db_connection():
+    """
+    Return this thread's SQLite connection, opening it on first use. Connections
+    are kept for the life of the thread, so callers must not close them; wrap
+    writes in `with conn:` so they commit, or roll back on error.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_NAME)
+        # Rows read by name (row["email"]) and convert straight to dicts
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
+    return conn
+
+
+def _create_schema(c):
+    """
+    Create any missing tables and indexes. Every statement is IF NOT EXISTS, so
+    this builds a fresh database and upgrades an existing one alike.
+    """
     c.execute("""
-        CREATE TABLE users (
+        CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             email TEXT UNIQUE NOT NULL,
             password_hash TEXT NOT NULL,
@@ -51,7 +106,7 @@ def init_db():
     """)
 
     c.execute("""
-        CREATE TABLE user_profiles (
+        CREATE TABLE IF NOT EXISTS user_profiles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_email TEXT NOT NULL,
             first_name TEXT,
@@ -69,7 +124,7 @@ def init_db():
     """)
 
     c.execute("""
-        CREATE TABLE job_applications (
+        CREATE TABLE IF NOT EXISTS job_applications (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_email TEXT NOT NULL,
             job_link TEXT NOT NULL,
@@ -85,150 +140,401 @@ def init_db():
         )
     """)
 
-    conn.commit()
-    conn.close()
+    # One row per (user, job link); lets inserts dedupe without a prior SELECT.
+    # Databases created before the index may hold repeats it would reject, so
+    # keep the first save of each link before building it.
+    if not _index_exists(c, "ix_job_user_link"):
+        c.execute("""
+            DELETE FROM job_applications
+            WHERE id NOT IN (
+                SELECT MIN(id) FROM job_applications GROUP BY user_email, job_link
+            )
+        """)
+        c.execute("""
+            CREATE UNIQUE INDEX ix_job_user_link
+            ON job_applications (user_email, job_link)
+        """)
+
+    # Newest-first listing / pagination of a user's jobs
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS ix_job_user_id
+        ON job_applications (user_email, id DESC)
+    """)
+
+    # One profile row per user; saves upsert against it. Older databases added a
+    # row per save and read the newest, so keep that one; the unique index also
+    # replaces the plain lookup index an earlier version created.
+    if not _index_exists(c, "ix_profile_user"):
+        c.execute("""
+            DELETE FROM user_profiles
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM user_profiles GROUP BY user_email
+            )
+        """)
+        c.execute("DROP INDEX IF EXISTS ix_profile_user_id")
+        c.execute("""
+            CREATE UNIQUE INDEX ix_profile_user
+            ON user_profiles (user_email)
+        """)
+
+
+def _index_exists(c, name):
+    row = c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def init_db():
+    """
+    Completely reset database: drop all tables if exist and recreate fresh.
+    This ensures no leftover data in users, profiles, or job_applications.
+    """
+    conn = get_db_connection()
+    c = conn.cursor()
+
+    # WAL lets readers run while a job submission is writing
+    c.execute("PRAGMA journal_mode=WAL;")
+
+    # All drops and creates commit together (one fsync). sqlite3 does not open a
+    # transaction before DDL on its own, so BEGIN explicitly.
+    with conn:
+        c.execute("BEGIN")
+
+        # Drop all tables if they exist
+        c.execute("DROP TABLE IF EXISTS job_applications;")
+        c.execute("DROP TABLE IF EXISTS user_profiles;")
+        c.execute("DROP TABLE IF EXISTS users;")
+
+        _create_schema(c)
+
+    # Ids restart after the drop; nothing cached for the old rows may survive
+    _email_cache.clear()
+    _profile_cache.clear()
+
+
+def migrate_db():
+    """
+    Bring an existing database up to the current schema without losing data.
+    Idempotent, so servers run it on every start.
+    """
+    conn = get_db_connection()
+    c = conn.cursor()
+    c.execute("PRAGMA journal_mode=WAL;")
+
+    # IMMEDIATE takes the write lock up front, so workers starting together
+    # migrate one after another instead of failing on a lock upgrade
+    with conn:
+        c.execute("BEGIN IMMEDIATE")
+        _create_schema(c)
+
+
+# ----------------------------
+# Per-process caches
+# ----------------------------
+_MISSING = object()  # cache miss marker; cached values may be falsy
+
+
+class _TTLCache:
+    """
+    Thread-safe LRU whose entries expire `ttl` seconds after they are stored.
+
+    Readers that miss should note `generation` before querying and hand it to
+    put(); an invalidate() that landed in between means the query may have read
+    the row before that write committed, so the value is not cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+        return default
+
+    def put(self, key, value, generation=None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)  # least recently used
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self.generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
 
 
 # ----------------------------
 # Registration & Login
 # ----------------------------
+# Compiled once; cheaper per registration than validators.email's RFC grammar
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+EMAIL_MAX_LENGTH = 254
+
+_INSERT_USER_SQL = "INSERT INTO users (email, password_hash, created_at) VALUES (?, ?, ?)"
+
+_LOGIN_SQL = """
+    SELECT u.id, u.password_hash, p.id AS profile_id,
+           p.first_name, p.last_name, p.address, p.city, p.mobile_number, p.github_url,
+           p.job_position, p.experience_months, p.skills, p.preferred_locations
+    FROM users u
+    LEFT JOIN user_profiles p ON p.user_email = u.email
+    WHERE u.email = ?
+"""
+
+_UPDATE_PASSWORD_SQL = "UPDATE users SET password_hash = ? WHERE id = ?"
+
+_EMAIL_BY_ID_SQL = "SELECT email FROM users WHERE id = ?"
+
+# user id -> email, consulted on every logged-in request. Emails never change,
+# so entries only need the TTL to pick up a database reset by another process.
+EMAIL_CACHE_SIZE = 1024
+EMAIL_CACHE_TTL = 60  # seconds
+_email_cache = _TTLCache(EMAIL_CACHE_SIZE, EMAIL_CACHE_TTL)
+
+
 def register_user(email: str, password: str) -> str:
-    if not validators.email(email):
+    if len(email) > EMAIL_MAX_LENGTH or not _EMAIL_RE.fullmatch(email):
         return "Invalid email format."
     if len(password) < 8:
         return "Password must be at least 8 characters."
 
-    password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
 
     conn = get_db_connection()
-    c = conn.cursor()
     try:
-        c.execute(
-            "INSERT INTO users (email, password_hash, created_at) VALUES (?, ?, ?)",
-            (email, password_hash.decode("utf-8"), datetime.utcnow().isoformat())
-        )
-        conn.commit()
+        with conn:
+            conn.execute(_INSERT_USER_SQL, (email, password_hash.decode("utf-8"), _utc_now_iso()))
         return "Registration successful!"
     except sqlite3.IntegrityError:
         return "Email already registered."
-    finally:
-        conn.close()
 
 
-def login_user(email: str, password: str) -> str:
+def login_user(email: str, password: str) -> tuple:
+    """
+    Return (message, user_id); user_id is None unless the login succeeded.
+    The user's profile comes back in the same query and seeds the profile
+    cache, so the first page after login needs no extra lookup.
+    """
+    generation = _profile_cache.generation
     conn = get_db_connection()
     c = conn.cursor()
-    c.execute("SELECT password_hash FROM users WHERE email = ?", (email,))
+    c.execute(_LOGIN_SQL, (email,))
     user = c.fetchone()
-    conn.close()
 
     if not user:
-        return "No account found with that email."
+        return "No account found with that email.", None
 
-    stored_hash = user[0].encode("utf-8")
+    stored_hash = user["password_hash"].encode("utf-8")
     if bcrypt.checkpw(password.encode("utf-8"), stored_hash):
-        return "Login successful!"
-    return "Incorrect password."
+        # Hashes keep the cost they were made with; migrate them to BCRYPT_ROUNDS
+        # so later logins pay the configured cost
+        if int(stored_hash.split(b"$")[2]) != BCRYPT_ROUNDS:
+            new_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+            with conn:
+                conn.execute(_UPDATE_PASSWORD_SQL, (new_hash.decode("utf-8"), user["id"]))
+        profile = {k: user[k] for k in _PROFILE_COLUMNS} if user["profile_id"] is not None else {}
+        _profile_cache.put(email, profile, generation)
+        _email_cache.put(user["id"], email)
+        return "Login successful!", user["id"]
+    return "Incorrect password.", None
+
+
+def get_email_by_id(user_id: int):
+    """Email of user_id, None if the user no longer exists; cached for EMAIL_CACHE_TTL."""
+    email = _email_cache.get(user_id)
+    if email is _MISSING:
+        conn = get_db_connection()
+        c = conn.cursor()
+        c.execute(_EMAIL_BY_ID_SQL, (user_id,))
+        row = c.fetchone()
+        email = row["email"] if row else None
+        if email is not None:
+            _email_cache.put(user_id, email)
+    return email
 
 
 # ----------------------------
 # Profile functions (local only)
 # ----------------------------
-def save_profile(data: dict) -> str:
+_PROFILE_COLUMNS = ("first_name", "last_name", "address", "city", "mobile_number", "github_url",
+                    "job_position", "experience_months", "skills", "preferred_locations")
+
+# Values for fields missing from a submitted profile dict
+_PROFILE_DEFAULTS = {**dict.fromkeys(_PROFILE_COLUMNS, ""), "experience_months": 0}
+
+# Per-process LRU of each user's profile. Writes through save_profile /
+# update_profile drop the entry; the TTL bounds how long another worker process
+# can keep serving a copy from before such a write.
+PROFILE_CACHE_SIZE = 1024
+PROFILE_CACHE_TTL = 60  # seconds
+_profile_cache = _TTLCache(PROFILE_CACHE_SIZE, PROFILE_CACHE_TTL)  # email -> profile dict
+
+# Insert the user's profile, or overwrite it in place if they already have one
+_UPSERT_PROFILE_SQL = """
+    INSERT INTO user_profiles
+    (user_email, first_name, last_name, address, city, mobile_number,
+     github_url, job_position, experience_months, skills, preferred_locations, created_at)
+    VALUES (:user_email, :first_name, :last_name, :address, :city, :mobile_number,
+            :github_url, :job_position, :experience_months, :skills, :preferred_locations, :created_at)
+    ON CONFLICT (user_email) DO UPDATE SET
+        first_name = excluded.first_name, last_name = excluded.last_name,
+        address = excluded.address, city = excluded.city,
+        mobile_number = excluded.mobile_number, github_url = excluded.github_url,
+        job_position = excluded.job_position, experience_months = excluded.experience_months,
+        skills = excluded.skills, preferred_locations = excluded.preferred_locations
+"""
+
+_PROFILE_SQL = """
+    SELECT first_name, last_name, address, city, mobile_number, github_url,
+           job_position, experience_months, skills, preferred_locations
+    FROM user_profiles
+    WHERE user_email = ?
+"""
+
+
+def _upsert_profile(data: dict):
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("""
-        INSERT INTO user_profiles
-        (user_email, first_name, last_name, address, city, mobile_number,
-         github_url, job_position, experience_months, skills, preferred_locations, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        data["user_email"],
-        data.get("first_name", ""),
-        data.get("last_name", ""),
-        data.get("address", ""),
-        data.get("city", ""),
-        data.get("mobile_number", ""),
-        data.get("github_url", ""),
-        data.get("job_position", ""),
-        data.get("experience_months", 0),
-        data.get("skills", ""),
-        data.get("preferred_locations", ""),
-        datetime.utcnow().isoformat()
-    ))
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        c.execute(_UPSERT_PROFILE_SQL, {**_PROFILE_DEFAULTS, **data, "created_at": _utc_now_iso()})
+    _profile_cache.invalidate(data["user_email"])
+
+
+def save_profile(data: dict) -> str:
+    _upsert_profile(data)
     return "Profile saved locally."
 
 
 def get_profile(user_email: str) -> dict:
+    """Profile for user_email ({} if none), served from the LRU while fresh."""
+    generation = _profile_cache.generation
+    profile = _profile_cache.get(user_email)
+    if profile is not _MISSING:
+        return profile
+
     conn = get_db_connection()
     c = conn.cursor()
-    c.execute("""
-        SELECT first_name, last_name, address, city, mobile_number, github_url,
-               job_position, experience_months, skills, preferred_locations
-        FROM user_profiles
-        WHERE user_email = ?
-        ORDER BY id DESC LIMIT 1
-    """, (user_email,))
+    c.execute(_PROFILE_SQL, (user_email,))
     row = c.fetchone()
-    conn.close()
-    if row:
-        return {
-            "first_name": row[0],
-            "last_name": row[1],
-            "address": row[2],
-            "city": row[3],
-            "mobile_number": row[4],
-            "github_url": row[5],
-            "job_position": row[6],
-            "experience_months": row[7],
-            "skills": row[8],
-            "preferred_locations": row[9],
-        }
-    return {}
+    profile = dict(row) if row else {}
+    _profile_cache.put(user_email, profile, generation)
+    return profile
 
 
 def update_profile(user_email: str, data: dict) -> str:
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("""
-        UPDATE user_profiles
-        SET first_name = ?, last_name = ?, address = ?, city = ?, mobile_number = ?,
-            github_url = ?, job_position = ?, experience_months = ?, skills = ?, preferred_locations = ?
-        WHERE id = (SELECT id FROM user_profiles WHERE user_email = ? ORDER BY id DESC LIMIT 1)
-    """, (
-        data.get("first_name", ""),
-        data.get("last_name", ""),
-        data.get("address", ""),
-        data.get("city", ""),
-        data.get("mobile_number", ""),
-        data.get("github_url", ""),
-        data.get("job_position", ""),
-        data.get("experience_months", 0),
-        data.get("skills", ""),
-        data.get("preferred_locations", ""),
-        user_email
-    ))
-    conn.commit()
-    conn.close()
+    _upsert_profile({**data, "user_email": user_email})
     return "Profile updated locally."
 
 
 # ----------------------------
 # Job applications functions (local + Google Sheets)
 # ----------------------------
-def job_exists_for_user(user_email: str, job_link: str) -> bool:
-    """Return True if the user already has a job entry with the same job_link."""
+# Values for fields missing from a submitted job dict
+_JOB_DEFAULTS = dict.fromkeys(
+    ("job_link", "company_name", "job_role", "job_location", "status",
+     "recruiter_name", "recruiter_email", "recruiter_phone", "comments"), "")
+
+_INSERT_JOB_SQL = """
+    INSERT OR IGNORE INTO job_applications
+    (user_email, job_link, company_name, job_role, job_location, status,
+     recruiter_name, recruiter_email, recruiter_phone, comments, created_at)
+    VALUES (:user_email, :job_link, :company_name, :job_role, :job_location, :status,
+            :recruiter_name, :recruiter_email, :recruiter_phone, :comments, :created_at)
+"""
+
+# Returns the new row's id, or no row when the link was a duplicate and ignored
+_INSERT_JOB_RETURNING_SQL = _INSERT_JOB_SQL + "RETURNING id\n"
+
+_JOB_COLUMNS = """
+    id, job_link, company_name, job_role, job_location, status,
+    recruiter_name, recruiter_email, recruiter_phone, comments, created_at,
+    CAST(julianday('now') - julianday(created_at) AS INTEGER) AS days_since_created
+"""
+
+_USER_JOBS_PAGE_SQL = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM job_applications
+    WHERE user_email = ? AND id < ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+_UPDATE_JOB_SQL = """
+    UPDATE job_applications
+    SET job_link = :job_link, company_name = :company_name, job_role = :job_role,
+        job_location = :job_location, status = :status, recruiter_name = :recruiter_name,
+        recruiter_email = :recruiter_email, recruiter_phone = :recruiter_phone, comments = :comments
+    WHERE id = :id
+"""
+
+# Only deletes the caller's own job; returns its link for the Sheets delete, or
+# no row if the id is unknown or belongs to someone else
+_DELETE_JOB_SQL = """
+    DELETE FROM job_applications WHERE id = :id AND user_email = :user_email
+    RETURNING job_link
+"""
+
+
+def _job_insert_params(data: dict, created_iso: str) -> dict:
+    return {**_JOB_DEFAULTS, **data, "created_at": created_iso}
+
+
+def save_job_application_if_new(data: dict) -> bool:
+    """
+    Save a job application to local DB and queue its Google Sheets append.
+    Returns False (and writes nothing) if the user already has this job_link;
+    the UNIQUE (user_email, job_link) index makes this a single statement.
+    """
+    now_iso = _utc_now_iso()
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        "SELECT id FROM job_applications WHERE user_email = ? AND job_link = ?",
-        (user_email, job_link)
-    )
-    exists = c.fetchone() is not None
-    conn.close()
-    return exists
+    with conn:
+        c = conn.cursor()
+        c.execute(_INSERT_JOB_RETURNING_SQL, _job_insert_params(data, now_iso))
+        inserted = c.fetchall()
+
+    if not inserted:
+        return False
+
+    _gs_enqueue(append_job_to_google_sheets, data, now_iso)
+    return True
+
+
+def save_job_applications_bulk(rows: list) -> int:
+    """
+    Save several job applications in one transaction, then queue Google Sheets
+    appends for the new ones. The UNIQUE (user_email, job_link) index skips links
+    the user already has or that repeat within `rows`; RETURNING tells which
+    rows went in. Returns the number of rows saved.
+    """
+    now_iso = _utc_now_iso()
+    conn = get_db_connection()
+    new_rows = []
+    with conn:
+        c = conn.cursor()
+        for row in rows:
+            c.execute(_INSERT_JOB_RETURNING_SQL, _job_insert_params(row, now_iso))
+            if c.fetchall():
+                new_rows.append(row)
+
+    for row in new_rows:
+        _gs_enqueue(append_job_to_google_sheets, row, now_iso)
+    return len(new_rows)
 
 
 def save_job_application(data: dict) -> str:
@@ -236,108 +542,168 @@ def save_job_application(data: dict) -> str:
     Save a job application to local DB and append to Google Sheets.
     Prevents duplicate job_link per user.
     """
-    if job_exists_for_user(data["user_email"], data["job_link"]):
+    if not save_job_application_if_new(data):
         return "Duplicate job link for this user. Record not added."
-
-    now_iso = datetime.utcnow().isoformat()
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("""
-        INSERT INTO job_applications
-        (user_email, job_link, company_name, job_role, job_location, status,
-         recruiter_name, recruiter_email, recruiter_phone, comments, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        data["user_email"],
-        data.get("job_link", ""),
-        data.get("company_name", ""),
-        data.get("job_role", ""),
-        data.get("job_location", ""),
-        data.get("status", ""),
-        data.get("recruiter_name", ""),
-        data.get("recruiter_email", ""),
-        data.get("recruiter_phone", ""),
-        data.get("comments", ""),
-        now_iso
-    ))
-    conn.commit()
-    conn.close()
-
-    # Append to Google Sheets
-    gs_msg = append_job_to_google_sheets(data, now_iso)
-    print("Google Sheets:", gs_msg)
     return "Job application saved successfully!"
 
 
-def get_user_applications(user_email: str) -> list:
+def get_user_applications_page(user_email: str, cursor: int = None, limit: int = 50) -> tuple:
+    """
+    Return (rows, next_cursor) for one page of the user's applications, newest first.
+    Keyset pagination on id: pass the returned next_cursor to fetch the following
+    page; it is None on the last page. Cost stays O(limit) however deep the page.
+    """
+    if cursor is None:
+        cursor = 2 ** 63 - 1  # largest SQLite rowid, i.e. start from the newest row
+
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("""
-        SELECT id, job_link, company_name, job_role, job_location, status,
-               recruiter_name, recruiter_email, recruiter_phone, comments, created_at
-        FROM job_applications
-        WHERE user_email = ?
-        ORDER BY id DESC
-    """, (user_email,))
-    rows = c.fetchall()
-    conn.close()
+    rows = [dict(row) for row in conn.execute(_USER_JOBS_PAGE_SQL, (user_email, cursor, limit + 1))]
+
+    # One extra row tells us whether another page exists
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1]["id"]
+    return rows, next_cursor
+
+
+_sheet_cache = {}
+_sheet_lock = threading.Lock()
+
+
+def _get_sheet():
+    """Worksheet handle, authorized once per process.
+
+    The credentials refresh their own access token, so the cached client stays
+    valid; this skips the key-file read and OAuth exchange on every Sheets call.
+    """
+    sheet = _sheet_cache.get("sheet")
+    if sheet is None:
+        with _sheet_lock:
+            sheet = _sheet_cache.get("sheet")
+            if sheet is None:
+                creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+                client = gspread.authorize(creds)
+                client.set_timeout(SHEETS_TIMEOUT)
+                sheet = _sheet_cache["sheet"] = client.open_by_key(SHEET_ID).sheet1
+    return sheet
+
+
+def _gs_worker():
+    """
+    Run queued Sheets calls in order; nobody waits for them, so just log.
+    Everything queued so far is taken at once, and each run of consecutive
+    appends goes out as a single append_rows request.
+    """
+    while True:
+        items = [_gs_q.get()]
+        try:
+            while items[-1] is not _GS_STOP:
+                items.append(_gs_q.get_nowait())
+        except queue.Empty:
+            pass
+        stop = items[-1] is _GS_STOP
+        if stop:
+            items.pop()
+
+        try:
+            for fn, group in itertools.groupby(items, key=lambda item: item[0]):
+                calls = [args for _, args in group]
+                if fn is append_job_to_google_sheets:
+                    print("Google Sheets:", append_jobs_to_google_sheets(calls))
+                else:
+                    for args in calls:
+                        print("Google Sheets:", fn(*args))
+        except Exception as e:
+            print("Google Sheets error:", e)
+        if stop:
+            return
+
+
+def _gs_drain():
+    """Let the worker flush the queue at exit, without blocking exit on a hung call."""
+    if _gs_worker_thread is not None:
+        _gs_q.put(_GS_STOP)
+        _gs_worker_thread.join(SHEETS_DRAIN_TIMEOUT)
+
+
+atexit.register(_gs_drain)
+
+
+def _gs_enqueue(fn, *args):
+    """Queue fn(*args) for the Sheets worker, starting it on first use.
+
+    Starting lazily keeps the thread out of a gunicorn preload master, where it
+    would not survive the fork into the workers.
+    """
+    global _gs_worker_thread
+    if _gs_worker_thread is None:
+        with _gs_worker_lock:
+            if _gs_worker_thread is None:
+                _gs_worker_thread = threading.Thread(target=_gs_worker, name="sheets", daemon=True)
+                _gs_worker_thread.start()
+    _gs_q.put((fn, args))
+
+
+_headers_verified = False
+
+
+def _ensure_sheet_headers(sheet):
+    """Check the header row once per process rather than downloading the sheet per append."""
+    global _headers_verified
+    if _headers_verified:
+        return
+    first_row = (sheet.get(SHEET_HEADER_RANGE) or [[]])[0]
+    if [h.strip() for h in first_row] != SHEET_HEADERS:
+        if first_row:
+            sheet.clear()
+        sheet.update([SHEET_HEADERS], SHEET_HEADER_RANGE)
+    _headers_verified = True
+
+
+# Days Since Created is worked out by the sheet from the same row's Created At
+# (column L), so it stays current without Python recomputing it
+_DAYS_SINCE_FORMULA = '=DATEDIF(DATEVALUE(LEFT(INDIRECT("L"&ROW()),10)),TODAY(),"D")'
+
+
+def _sheet_text(value) -> str:
+    """
+    Rows are sent USER_ENTERED so the formula above evaluates; a leading
+    apostrophe keeps every other cell literal text, so user input such as
+    "=..." or a phone number is never read as a formula or number.
+    """
+    return "'" + value if value else ""
+
+
+def _sheet_row(data: dict, created_iso: str) -> list:
     return [
-        {
-            "id": row[0],
-            "job_link": row[1],
-            "company_name": row[2],
-            "job_role": row[3],
-            "job_location": row[4],
-            "status": row[5],
-            "recruiter_name": row[6],
-            "recruiter_email": row[7],
-            "recruiter_phone": row[8],
-            "comments": row[9],
-            "created_at": row[10]
-        } for row in rows
+        _sheet_text(data.get("user_email", "")),
+        _sheet_text(data.get("job_link", "")),
+        _sheet_text(data.get("company_name", "")),
+        _sheet_text(data.get("job_role", "")),
+        _sheet_text(data.get("job_location", "")),
+        _sheet_text(data.get("status", "")),
+        _sheet_text(data.get("recruiter_name", "")),
+        _sheet_text(data.get("recruiter_email", "")),
+        _sheet_text(data.get("recruiter_phone", "")),
+        _DAYS_SINCE_FORMULA,
+        _sheet_text(data.get("comments", "")),
+        _sheet_text(created_iso)
     ]
 
 
 def append_job_to_google_sheets(data: dict, created_iso: str) -> str:
+    return append_jobs_to_google_sheets([(data, created_iso)])
+
+
+def append_jobs_to_google_sheets(jobs: list) -> str:
+    """Append (data, created_iso) pairs to the sheet in one request."""
     try:
-        creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(SHEET_ID).sheet1
-
-        headers = [
-            "User Email", "Job Link", "Company Name", "Job Role", "Job Location", "Status",
-            "Recruiter Name", "Recruiter Email", "Recruiter Phone", "Days Since Created",
-            "Comments", "Created At"
-        ]
-
-        all_values = sheet.get_all_values()
-        if not all_values:
-            sheet.append_row(headers)
-        else:
-            first_row = all_values[0]
-            if len(first_row) < len(headers) or any(h1.strip() != h2.strip() for h1, h2 in zip(first_row, headers)):
-                sheet.clear()
-                sheet.append_row(headers)
-
-        created_dt = datetime.fromisoformat(created_iso)
-        days_since = (datetime.utcnow() - created_dt).days
-
-        row = [
-            data.get("user_email", ""),
-            data.get("job_link", ""),
-            data.get("company_name", ""),
-            data.get("job_role", ""),
-            data.get("job_location", ""),
-            data.get("status", ""),
-            data.get("recruiter_name", ""),
-            data.get("recruiter_email", ""),
-            data.get("recruiter_phone", ""),
-            days_since,
-            data.get("comments", ""),
-            created_iso
-        ]
-        sheet.append_row(row)
-        return "Job appended to Google Sheets."
+        sheet = _get_sheet()
+        _ensure_sheet_headers(sheet)
+        sheet.append_rows([_sheet_row(data, created_iso) for data, created_iso in jobs],
+                          value_input_option="USER_ENTERED")
+        return f"{len(jobs)} job(s) appended to Google Sheets."
     except Exception as e:
         print("Google Sheets error:", e)
         return f"Failed to append job to Google Sheets: {e}"
@@ -346,80 +712,53 @@ def append_job_to_google_sheets(data: dict, created_iso: str) -> str:
 # Optional update/delete functions
 def update_job_application(job_id: int, data: dict) -> str:
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("""
-        UPDATE job_applications
-        SET job_link = ?, company_name = ?, job_role = ?, job_location = ?, status = ?,
-            recruiter_name = ?, recruiter_email = ?, recruiter_phone = ?, comments = ?
-        WHERE id = ?
-    """, (
-        data.get("job_link", ""),
-        data.get("company_name", ""),
-        data.get("job_role", ""),
-        data.get("job_location", ""),
-        data.get("status", ""),
-        data.get("recruiter_name", ""),
-        data.get("recruiter_email", ""),
-        data.get("recruiter_phone", ""),
-        data.get("comments", ""),
-        job_id
-    ))
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        c.execute(_UPDATE_JOB_SQL, {**_JOB_DEFAULTS, **data, "id": job_id})
     return "Job updated locally."
 
 
-def delete_job_application_by_id(job_id: int) -> str:
+def delete_job_application_by_id(job_id: int, user_email: str) -> str:
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("SELECT job_link, user_email FROM job_applications WHERE id = ?", (job_id,))
-    row = c.fetchone()
-    if not row:
-        conn.close()
+    with conn:
+        rows = conn.execute(_DELETE_JOB_SQL, {"id": job_id, "user_email": user_email}).fetchall()
+    if not rows:
         return "No such job record found."
 
-    job_link, user_email = row[0], row[1]
+    job_link = rows[0]["job_link"]
 
-    # Delete from local DB
-    c.execute("DELETE FROM job_applications WHERE id = ?", (job_id,))
-    conn.commit()
-    conn.close()
+    # Google Sheets delete runs in the background, after any queued append of this row
+    _gs_enqueue(delete_job_from_google_sheets, user_email, job_link)
 
-    # Delete from Google Sheets
-    sheet_msg = delete_job_from_google_sheets(user_email, job_link)
-    print("Google Sheets:", sheet_msg)
-
-    return f"Job application deleted successfully ({sheet_msg})"
+    return "Job application deleted successfully."
 
 
 def delete_job_from_google_sheets(user_email: str, job_link: str) -> str:
     try:
-        creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(SHEET_ID).sheet1
+        sheet = _get_sheet()
 
-        data = sheet.get_all_values()
+        # The append path keeps SHEET_HEADERS in row 1, so the match only needs columns A:B
+        data = sheet.get("A:B")
         if not data or len(data) <= 1:
             return "No rows to delete in Google Sheet."
 
-        headers = data[0]
-        user_email_col = headers.index("User Email") + 1 if "User Email" in headers else None
-        job_link_col = headers.index("Job Link") + 1 if "Job Link" in headers else None
-
-        if not user_email_col or not job_link_col:
+        if [h.strip() for h in data[0][:2]] != SHEET_HEADERS[:2]:
             return "Required columns not found in Google Sheet."
 
-        rows_to_delete = []
-        for i, row in enumerate(data[1:], start=2):
-            if len(row) >= max(user_email_col, job_link_col):
-                if row[user_email_col - 1] == user_email and row[job_link_col - 1] == job_link:
-                    rows_to_delete.append(i)
+        key = [user_email, job_link]
+        rows_to_delete = [i for i, row in enumerate(data[1:], start=2) if row[:2] == key]
 
         if not rows_to_delete:
             return "No matching row found in Google Sheet."
 
-        for row_idx in sorted(rows_to_delete, reverse=True):
-            sheet.delete_rows(row_idx)
+        # One batchUpdate for every match; bottom-up so earlier indexes stay valid
+        sheet.spreadsheet.batch_update({"requests": [
+            {"deleteDimension": {"range": {
+                "sheetId": sheet.id, "dimension": "ROWS",
+                "startIndex": row_idx - 1, "endIndex": row_idx,
+            }}}
+            for row_idx in sorted(rows_to_delete, reverse=True)
+        ]})
 
         return "Deleted from Google Sheet."
     except Exception as e:
@@ -432,17 +771,10 @@ def delete_job_from_google_sheets(user_email: str, job_link: str) -> str:
 # ----------------------------
 def clear_google_sheet_rows():
     try:
-        creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(SHEET_ID).sheet1
+        sheet = _get_sheet()
 
         sheet.clear()
-        headers = [
-            "User Email", "Job Link", "Company Name", "Job Role", "Job Location", "Status",
-            "Recruiter Name", "Recruiter Email", "Recruiter Phone", "Days Since Created",
-            "Comments", "Created At"
-        ]
-        sheet.append_row(headers)
+        sheet.append_row(SHEET_HEADERS)
         print("Google Sheet cleared and headers re-added.")
     except Exception as e:
         print("Error clearing Google Sheet:", e)
@@ -3,6 +3,8 @@ clear_users.py
 Fully clears all data and reinitializes the database,
 including users, profiles, and job applications.
 Also clears the Google Sheets job rows.
+The database runs in WAL mode, so users.db-wal / users.db-shm files next to
+users.db are expected; SQLite manages them and they need no manual cleanup.
 """
 
 import backend as backend
@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+import backend
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """
+    Fresh database in tmp_path for each test. Sheets writes are recorded, not
+    sent: the fixture yields the list of (function name, args) that were queued.
+    """
+    monkeypatch.setattr(backend, "DB_NAME", str(tmp_path / "users.db"))
+    monkeypatch.setattr(backend._local, "conn", None, raising=False)
+    queued = []
+    monkeypatch.setattr(backend, "_gs_enqueue", lambda fn, *args: queued.append((fn.__name__, args)))
+    backend.init_db()
+    yield queued
+    backend.get_db_connection().close()
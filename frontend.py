@@ -4,19 +4,103 @@ Flask-based frontend for Job Apply Bot.
 Handles registration, login, dashboard (profile edit), job application form, and applications list.
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash, session
-import backend as backend
-from datetime import datetime
+from flask import Flask, render_template, stream_template, request, redirect, url_for, flash, session, g
+from backend import (
+    migrate_db, register_user, login_user, get_email_by_id,
+    get_profile, save_profile,
+    save_job_application_if_new, save_job_applications_bulk,
+    get_user_applications_page, delete_job_application_by_id,
+)
+import os
+import secrets
+from datetime import timedelta
+
+# Every worker must sign sessions with the same key, so it has to come from the
+# environment. Only the development server may fall back to a throwaway key.
+SECRET_KEY = os.environ.get("SECRET_KEY")
+if not SECRET_KEY:
+    if os.environ.get("FLASK_ENV") != "development":
+        raise RuntimeError("Set the SECRET_KEY environment variable (or FLASK_ENV=development).")
+    SECRET_KEY = secrets.token_hex(32)
 
 app = Flask(__name__)
-app.secret_key = "supersecretkey"
+app.config.update(
+    SECRET_KEY=SECRET_KEY,
+    SESSION_COOKIE_HTTPONLY=True,
+    SESSION_COOKIE_SAMESITE="Lax",
+    PERMANENT_SESSION_LIFETIME=timedelta(hours=8),
+    # Re-sign and resend the session cookie only when the session changes
+    SESSION_REFRESH_EACH_REQUEST=False,
+)
+# Keep every compiled template in memory. TEMPLATES_AUTO_RELOAD is left unset so
+# Flask only stats template files for changes when running in debug mode.
+app.jinja_options = {**app.jinja_options, "cache_size": 400}
+
+# Set FLASK_PROFILE=1 to dump cProfile stats per request (view with snakeviz)
+if os.environ.get("FLASK_PROFILE"):
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    profile_dir = os.environ.get("FLASK_PROFILE_DIR", "profiles")
+    os.makedirs(profile_dir, exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, profile_dir=profile_dir, restrictions=[30])
+
+APPLICATIONS_PER_PAGE = 50
+APPLICATIONS_MAX_PER_PAGE = 200
+
+# Plain text form fields, read in one pass on POST
+PROFILE_FIELDS = ("first_name", "last_name", "address", "city", "mobile_number",
+                  "github_url", "job_position", "skills", "preferred_locations")
+JOB_FIELDS = ("company_name", "job_role", "job_location", "status",
+              "recruiter_name", "recruiter_email", "recruiter_phone", "comments")
+
+# --------------------
+# Current user
+# --------------------
+def current_user_email():
+    """Email of the logged-in user, resolved from session["uid"] once per request."""
+    if "user_email" not in g:
+        uid = session.get("uid")
+        email = get_email_by_id(uid) if uid is not None else None
+        # Ids are reused after a database reset, so a uid alone could name a
+        # different account; only accept it for the email it was issued to
+        if email != session.get("email"):
+            session.clear()
+            email = None
+        g.user_email = email
+    return g.user_email
+
+# --------------------
+# Template URLs
+# --------------------
+# Argument-free URLs used by every template, built once per process
+NAV_ENDPOINTS = ("login", "register", "dashboard", "job_details", "applications", "profile", "logout")
+_NAV_URLS = {}
+
+
+@app.context_processor
+def inject_nav_urls():
+    if not _NAV_URLS:
+        _NAV_URLS.update({"URL_" + endpoint.upper(): url_for(endpoint) for endpoint in NAV_ENDPOINTS})
+    return _NAV_URLS
+
+# --------------------
+# Login guard
+# --------------------
+LOGIN_REQUIRED = {"dashboard", "job_details", "applications", "profile", "delete_job"}
+
+
+@app.before_request
+def require_login():
+    if request.endpoint in LOGIN_REQUIRED and current_user_email() is None:
+        flash("Please log in first!")
+        return redirect(url_for("login"))
 
 # --------------------
 # Home
 # --------------------
 @app.route("/")
 def home():
-    return redirect(url_for("login"))
+    # Permanent, so browsers cache it and skip this hop on later visits
+    return redirect(url_for("login"), code=301)
 
 # --------------------
 # Registration
@@ -26,11 +110,12 @@ def register():
     if request.method == "POST":
         email = request.form["email"]
         password = request.form["password"]
-        msg = backend.register_user(email, password)
-        flash(msg)
+        msg = register_user(email, password)
         if "Registration successful!" in msg:
+            flash(msg)
             return redirect(url_for("login"))
-        return redirect(url_for("register"))
+        # Failed submits re-render in place instead of costing a redirect round trip
+        return render_template("register.html", error=msg)
     return render_template("register.html")
 
 # --------------------
@@ -41,12 +126,13 @@ def login():
     if request.method == "POST":
         email = request.form["email"]
         password = request.form["password"]
-        msg = backend.login_user(email, password)
-        flash(msg)
-        if "Login successful!" in msg:
-            session["user"] = email
+        msg, user_id = login_user(email, password)
+        if user_id is not None:
+            session.permanent = True
+            session["uid"] = user_id
+            session["email"] = email
             return redirect(url_for("dashboard"))
-        return redirect(url_for("login"))
+        return render_template("login.html", error=msg)
     return render_template("login.html")
 
 # --------------------
@@ -54,68 +140,57 @@ def login():
 # --------------------
 @app.route("/dashboard", methods=["GET", "POST"])
 def dashboard():
-    if "user" not in session:
-        flash("Please log in first!")
-        return redirect(url_for("login"))
-
-    profile_data = backend.get_profile(session["user"])
+    email = current_user_email()
 
     if request.method == "POST":
-        data = {
-            "user_email": session["user"],
-            "first_name": request.form.get("first_name", ""),
-            "last_name": request.form.get("last_name", ""),
-            "address": request.form.get("address", ""),
-            "city": request.form.get("city", ""),
-            "mobile_number": request.form.get("mobile_number", ""),
-            "github_url": request.form.get("github_url", ""),
-            "job_position": request.form.get("job_position", ""),
-            "experience_months": int(request.form.get("experience_months", 0)),
-            "skills": request.form.get("skills", ""),
-            "preferred_locations": request.form.get("preferred_locations", ""),
-        }
-
-        if profile_data:
-            backend.update_profile(session["user"], data)
-        else:
-            backend.save_profile(data)
-
-        flash("Profile saved successfully!")
+        try:
+            experience_months = int(request.form.get("experience_months") or 0)
+        except ValueError:
+            return render_template("dashboard.html", profile=request.form,
+                                   error="Experience must be a whole number of months.")
+
+        form = request.form
+        data = {k: form.get(k, "") for k in PROFILE_FIELDS}
+        data["user_email"] = email
+        data["experience_months"] = experience_months
+
+        # Inserts the first profile, updates it after that
+        save_profile(data)
+
         # redirect to job details page for new application entry
         return redirect(url_for("job_details"))
 
-    return render_template("dashboard.html", profile=profile_data)
+    return render_template("dashboard.html", profile=get_profile(email))
 
 # --------------------
 # Job Application Form
 # --------------------
 @app.route("/job_details", methods=["GET", "POST"])
 def job_details():
-    if "user" not in session:
-        flash("Please log in first!")
-        return redirect(url_for("login"))
+    email = current_user_email()
 
     if request.method == "POST":
-        data = {
-            "user_email": session["user"],
-            "job_link": request.form.get("job_link", ""),
-            "company_name": request.form.get("company_name", ""),
-            "job_role": request.form.get("job_role", ""),
-            "job_location": request.form.get("job_location", ""),
-            "status": request.form.get("status", ""),
-            "recruiter_name": request.form.get("recruiter_name", ""),
-            "recruiter_email": request.form.get("recruiter_email", ""),
-            "recruiter_phone": request.form.get("recruiter_phone", ""),
-            "comments": request.form.get("comments", ""),
-        }
-        
-        from backend import job_exists_for_user, save_job_application
-        if job_exists_for_user(data["user_email"], data["job_link"]):
+        form = request.form
+        data = {k: form.get(k, "") for k in JOB_FIELDS}
+        data["user_email"] = email
+
+        # The single link field plus any links pasted one per line; all share the details above
+        links = [request.form.get("job_link", "").strip()]
+        links += request.form.get("job_links", "").splitlines()
+        links = [link.strip() for link in links if link.strip()]
+        if not links:
+            return render_template("job_details.html", success_message="Please enter a job link.")
+
+        if len(links) > 1:
+            saved = save_job_applications_bulk([dict(data, job_link=link) for link in links])
+            return render_template("job_details.html",
+                                   success_message=f"{saved} of {len(links)} job links saved; duplicates skipped.")
+
+        data["job_link"] = links[0]
+        if not save_job_application_if_new(data):
             return render_template("job_details.html", success_message="Duplicate Job Link! Record not added.")
 
-        backend.save_job_application(data)
         return render_template("job_details.html", success_message="Form filled successfully!")
-        return redirect(url_for("job_details"))  # clear form after submit
 
     return render_template("job_details.html")
 
@@ -123,33 +198,37 @@ def job_details():
 # --------------------
 # Applications List
 # --------------------
+def render_applications(**context):
+    """Stream applications.html to the client chunk by chunk as Jinja renders it."""
+    return app.response_class(stream_template("applications.html", **context))
+
+
 @app.route("/applications")
 def applications():
-    if "user" not in session:
-        flash("Please log in first!")
-        return redirect(url_for("login"))
+    email = current_user_email()
 
-    apps = backend.get_user_applications(session["user"])
-    # Compute Days Since Created
-    for job in apps:
-        created_dt = datetime.fromisoformat(job["created_at"])
-        job["days_since_created"] = (datetime.utcnow() - created_dt).days
+    cursor = request.args.get("cursor", type=int)
+    per = request.args.get("per", APPLICATIONS_PER_PAGE, type=int)
+    per = max(1, min(per, APPLICATIONS_MAX_PER_PAGE))
 
-    return render_template("applications.html", jobs=apps)
+    # days_since_created is computed by the query itself
+    apps, next_cursor = get_user_applications_page(email, cursor=cursor, limit=per)
+    return render_applications(jobs=apps, next_cursor=next_cursor, per=per)
 
 @app.route("/delete_job/<int:job_id>", methods=["POST"])
 def delete_job(job_id):
-    if "user" not in session:
-        flash("Please log in first!")
-        return redirect(url_for("login"))
+    email = current_user_email()
 
-    msg = backend.delete_job_application_by_id(job_id)
-    flash(msg)
-    return redirect(url_for("applications"))
+    msg = delete_job_application_by_id(job_id, email)
+    # Show the refreshed first page right away rather than redirecting to it
+    apps, next_cursor = get_user_applications_page(email, limit=APPLICATIONS_PER_PAGE)
+    return render_applications(jobs=apps, next_cursor=next_cursor,
+                               per=APPLICATIONS_PER_PAGE, message=msg)
 
 @app.route("/logout")
 def logout():
-    session.pop("user", None)
+    session.pop("uid", None)
+    session.pop("email", None)
     flash("Logged out successfully.")
     return redirect(url_for("login"))
 
@@ -160,18 +239,28 @@ def logout():
 # --------------------
 @app.route("/profile")
 def profile():
-    if "user" not in session:
-        flash("Please log in first!")
-        return redirect(url_for("login"))
+    email = current_user_email()
 
-    profile_data = backend.get_profile(session["user"])
+    profile_data = get_profile(email)
     if not profile_data:
-        flash("No profile found. Please fill your details.")
-        return redirect(url_for("dashboard"))
+        # Shown inline: dashboard.html never reads flashed messages, so a flash
+        # would only sit in (and grow) the session cookie
+        return render_template("dashboard.html", profile={},
+                               error="No profile found. Please fill your details.")
 
     return render_template("profile.html", profile=profile_data)
 
 
+def preload_templates():
+    """Compile every template up front so no request pays the first-render cost."""
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+
+preload_templates()
+
+
+# Development server only; production runs under gunicorn via wsgi.py
 if __name__ == "__main__":
-    backend.init_db()
-    app.run(debug=True)
+    migrate_db()
+    app.run(debug=os.environ.get("FLASK_ENV") == "development")
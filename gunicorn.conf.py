@@ -0,0 +1,16 @@
+"""
+gunicorn.conf.py
+Production server settings, used as: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = 8
+keepalive = 30  # seconds an idle keep-alive connection stays open
+
+# Import the app once in the master so workers fork with templates already compiled
+preload_app = True
@@ -0,0 +1,75 @@
+import backend
+
+
+def job(user_email, job_link, **fields):
+    return {"user_email": user_email, "job_link": job_link, "company_name": "Acme", **fields}
+
+
+def job_links(user_email):
+    rows = backend.get_db_connection().execute(
+        "SELECT job_link FROM job_applications WHERE user_email = ? ORDER BY id", (user_email,))
+    return [row["job_link"] for row in rows]
+
+
+def test_delete_refuses_another_users_job(db):
+    backend.save_job_application_if_new(job("owner@example.com", "https://jobs.example.com/1"))
+    job_id, = backend.get_db_connection().execute("SELECT id FROM job_applications").fetchone()
+    db.clear()
+
+    msg = backend.delete_job_application_by_id(job_id, "intruder@example.com")
+
+    assert msg == "No such job record found."
+    assert job_links("owner@example.com") == ["https://jobs.example.com/1"]
+    assert db == []
+
+    msg = backend.delete_job_application_by_id(job_id, "owner@example.com")
+
+    assert msg == "Job application deleted successfully."
+    assert job_links("owner@example.com") == []
+    assert db == [("delete_job_from_google_sheets", ("owner@example.com", "https://jobs.example.com/1"))]
+
+
+def test_pagination_crosses_page_boundary(db):
+    links = [f"https://jobs.example.com/{i}" for i in range(5)]
+    for link in links:
+        backend.save_job_application_if_new(job("a@example.com", link))
+    backend.save_job_application_if_new(job("b@example.com", "https://jobs.example.com/other"))
+
+    first, cursor = backend.get_user_applications_page("a@example.com", limit=2)
+    second, cursor2 = backend.get_user_applications_page("a@example.com", cursor=cursor, limit=2)
+    last, cursor3 = backend.get_user_applications_page("a@example.com", cursor=cursor2, limit=2)
+
+    pages = [[row["job_link"] for row in page] for page in (first, second, last)]
+    assert pages == [links[4:2:-1], links[2:0:-1], links[:1]]
+    assert cursor == first[-1]["id"] and cursor2 == second[-1]["id"]
+    assert cursor3 is None
+
+
+def test_pagination_exact_fit_has_no_next_page(db):
+    for i in range(2):
+        backend.save_job_application_if_new(job("a@example.com", f"https://jobs.example.com/{i}"))
+
+    rows, cursor = backend.get_user_applications_page("a@example.com", limit=2)
+
+    assert len(rows) == 2
+    assert cursor is None
+
+
+def test_bulk_save_skips_duplicate_links(db):
+    backend.save_job_application_if_new(job("a@example.com", "https://jobs.example.com/old"))
+    backend.save_job_application_if_new(job("b@example.com", "https://jobs.example.com/new"))
+    db.clear()
+
+    links = ["https://jobs.example.com/old", "https://jobs.example.com/new",
+             "https://jobs.example.com/new", "https://jobs.example.com/other"]
+    saved = backend.save_job_applications_bulk([job("a@example.com", link) for link in links])
+
+    assert saved == 2
+    assert job_links("a@example.com") == ["https://jobs.example.com/old",
+                                          "https://jobs.example.com/new",
+                                          "https://jobs.example.com/other"]
+    # Only the rows actually inserted go to Sheets
+    assert [(name, args[0]["job_link"]) for name, args in db] == [
+        ("append_job_to_google_sheets", "https://jobs.example.com/new"),
+        ("append_job_to_google_sheets", "https://jobs.example.com/other"),
+    ]
@@ -0,0 +1,12 @@
+"""
+wsgi.py
+WSGI entry point for production servers:
+    gunicorn -c gunicorn.conf.py wsgi:app
+Importing migrates the database in place (migrate_db keeps existing data);
+`python backend.py` still resets it from scratch.
+"""
+
+from backend import migrate_db
+from frontend import app
+
+migrate_db()